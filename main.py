@@ -9,7 +9,7 @@ ROOT = Path(__file__).parent
 
 def main():
     os.chdir(ROOT)
-    httpd = http.server.HTTPServer(("", PORT), http.server.SimpleHTTPRequestHandler)
+    httpd = http.server.ThreadingHTTPServer(("", PORT), http.server.SimpleHTTPRequestHandler)
     print(f"Serving QEM Zoo at http://localhost:{PORT}")
     webbrowser.open(f"http://localhost:{PORT}")
     httpd.serve_forever()
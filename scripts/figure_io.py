@@ -0,0 +1,66 @@
+"""Shared helpers for writing the diagram scripts' figures to disk."""
+
+import hashlib
+import os
+from pathlib import Path
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_svg import FigureCanvasSVG
+
+try:
+    import cairosvg
+except (ImportError, OSError):  # package missing, or libcairo not found
+    cairosvg = None
+
+# The PNGs are shown roughly 1:1 on the site; set QEMZOO_DPI=300 for print-quality output
+DPI = int(os.environ.get('QEMZOO_DPI', 96))
+
+
+def save_figure(fig, png_path, svg_path=None, dpi=DPI):
+    """Write a figure as PNG, and optionally SVG, through the backend canvases directly.
+
+    The same Figure is handed to an Agg and an SVG canvas in turn, skipping
+    pyplot's savefig dispatch and backend switching for each format. When an
+    SVG is written and cairosvg is installed, the PNG is rasterised from that
+    SVG instead, so matplotlib only renders the figure once.
+    """
+    if svg_path is not None:
+        FigureCanvasSVG(fig).print_figure(svg_path, format='svg',
+                                          facecolor='white', edgecolor='none')
+        if cairosvg is not None:
+            cairosvg.svg2png(url=str(svg_path), write_to=str(png_path),
+                             output_width=round(fig.get_figwidth() * dpi))
+            return
+    FigureCanvasAgg(fig).print_figure(png_path, format='png', dpi=dpi,
+                                      facecolor='white', edgecolor='none')
+
+
+def source_hash(*source_paths):
+    """Short hash of the given sources, this module and the output dpi, stamped beside each PNG."""
+    digest = hashlib.sha1(Path(__file__).read_bytes())
+    for path in source_paths:
+        digest.update(Path(path).read_bytes())
+    digest.update(str(DPI).encode())
+    return digest.hexdigest()[:12]
+
+
+def _stamp_path(png_path):
+    return Path(f"{png_path}.sha1")
+
+
+def is_current(src_hash, png_path, svg_path=None):
+    """Whether the outputs exist and were last written from sources hashing to src_hash.
+
+    Callers check this before building a figure, so an unchanged diagram
+    costs a file read instead of a full layout and render.
+    """
+    stamp = _stamp_path(png_path)
+    outputs = [png_path] if svg_path is None else [png_path, svg_path]
+    return (stamp.exists() and stamp.read_text() == src_hash
+            and all(Path(path).exists() for path in outputs))
+
+
+def save_stamped(fig, src_hash, png_path, svg_path=None, dpi=DPI):
+    """save_figure, then record src_hash beside the PNG for is_current."""
+    save_figure(fig, png_path, svg_path, dpi)
+    _stamp_path(png_path).write_text(src_hash)
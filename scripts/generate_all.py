@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Generate every workflow and noise diagram in one run.
+
+The diagram scripts are imported as modules, so matplotlib and numpy are
+loaded once here rather than once per script, and all of their figures
+share a single process pool.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import generate_kik_workflow
+import generate_new_technique_diagrams
+import generate_noise_diagrams
+import generate_sas_workflow
+import generate_zne_workflow
+
+# Each script's submit_figures(executor) queues its figures and returns the futures
+SCRIPTS = [
+    generate_kik_workflow,
+    generate_new_technique_diagrams,
+    generate_noise_diagrams,
+    generate_sas_workflow,
+    generate_zne_workflow,
+]
+
+
+def main():
+    with ProcessPoolExecutor() as executor:
+        futures = [future for script in SCRIPTS for future in script.submit_figures(executor)]
+        for future in futures:
+            future.result()
+
+    print("\nAll diagrams generated!")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,12 @@ Each visualization shows:
 Requires: qiskit, matplotlib, numpy
 """
 
+import argparse
+import math
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # headless: files only, never a GUI window
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 from pathlib import Path
@@ -73,19 +78,50 @@ NOISE_TYPES = {
 }
 
 
-def bloch_sphere_wireframe(ax, alpha=0.15):
-    """Draw a wireframe Bloch sphere."""
+def _sphere_mesh():
+    """Compute the (x, y, z) surface mesh of the unit sphere."""
     u = np.linspace(0, 2 * np.pi, 50)
     v = np.linspace(0, np.pi, 30)
     x = np.outer(np.cos(u), np.sin(v))
     y = np.outer(np.sin(u), np.sin(v))
     z = np.outer(np.ones(np.size(u)), np.cos(v))
-    ax.plot_surface(x, y, z, alpha=alpha, color='lightgray', edgecolor='none')
+    return x, y, z
+
+
+def _initial_states():
+    """Compute a grid of pure states on the Bloch sphere, plus both poles."""
+    n_phi = 12
+    n_theta = 8
+    phi = np.linspace(0, 2 * np.pi, n_phi, endpoint=False)
+    theta = np.linspace(0.2, np.pi - 0.2, n_theta)
+    t, p = np.meshgrid(theta, phi, indexing='ij')
+
+    points_x = np.append((np.sin(t) * np.cos(p)).ravel(), [0, 0])
+    points_y = np.append((np.sin(t) * np.sin(p)).ravel(), [0, 0])
+    points_z = np.append(np.cos(t).ravel(), [1, -1])
+    return points_x, points_y, points_z
+
+
+# The sphere mesh and initial states are the same for every panel, so build them once
+_SPHERE_XYZ = _sphere_mesh()
+_INIT_STATES = _initial_states()
+# Initial states are colored by their z-coordinate in every panel
+_INIT_COLORS = plt.cm.RdYlBu((_INIT_STATES[2] + 1) / 2)
+_AXIS_LINES = (
+    ([-1.2, 1.2], [0, 0], [0, 0]),
+    ([0, 0], [-1.2, 1.2], [0, 0]),
+    ([0, 0], [0, 0], [-1.2, 1.2]),
+)
+
+
+def bloch_sphere_wireframe(ax, alpha=0.15):
+    """Draw a wireframe Bloch sphere."""
+    x, y, z = _SPHERE_XYZ
+    ax.plot_surface(x, y, z, alpha=alpha, color='lightgray', edgecolor='none', rasterized=True)
 
     # Draw axis lines
-    ax.plot([-1.2, 1.2], [0, 0], [0, 0], 'k-', alpha=0.3, linewidth=0.5)
-    ax.plot([0, 0], [-1.2, 1.2], [0, 0], 'k-', alpha=0.3, linewidth=0.5)
-    ax.plot([0, 0], [0, 0], [-1.2, 1.2], 'k-', alpha=0.3, linewidth=0.5)
+    for xs, ys, zs in _AXIS_LINES:
+        ax.plot(xs, ys, zs, 'k-', alpha=0.3, linewidth=0.5)
 
     # Label axes
     ax.text(1.35, 0, 0, 'X', fontsize=10, ha='center')
@@ -94,6 +130,20 @@ def bloch_sphere_wireframe(ax, alpha=0.15):
     ax.text(0, 0, -1.35, '|1⟩', fontsize=10, ha='center')
 
 
+def _rotation_factors(param):
+    """Return (cos θ, sin θ) for a rotation angle of param·π."""
+    theta = param * math.pi
+    return math.cos(theta), math.sin(theta)
+
+
+# Scalar factors for every parameter in NOISE_TYPES, so apply_noise only does array work
+_ROT_TABLE = {p: _rotation_factors(p) for info in NOISE_TYPES.values()
+              if info['effect'] == 'rotate' for p in info['params']}
+_SQRT1M = {p: math.sqrt(1 - p) for info in NOISE_TYPES.values()
+           if info['effect'] in ('amplitude_damp', 'decoherence') for p in info['params']}
+_S2 = 1 / math.sqrt(2)
+
+
 def apply_noise(points, noise_type, param):
     """Apply noise transformation to Bloch sphere points."""
     x, y, z = points
@@ -125,8 +175,11 @@ def apply_noise(points, noise_type, param):
     elif noise_type == "amplitude_damp":
         # Amplitude damping: shrink and drift toward |0⟩
         gamma = param
-        new_x = np.sqrt(1 - gamma) * x
-        new_y = np.sqrt(1 - gamma) * y
+        sqrt_1m = _SQRT1M.get(gamma)
+        if sqrt_1m is None:
+            sqrt_1m = math.sqrt(1 - gamma)
+        new_x = sqrt_1m * x
+        new_y = sqrt_1m * y
         new_z = (1 - gamma) * z + gamma  # drift toward +z (|0⟩)
         return new_x, new_y, new_z
 
@@ -135,14 +188,23 @@ def apply_noise(points, noise_type, param):
         # Axis u = (0, 1, 1)/sqrt(2) displaces states across latitude bands,
         # making the rotation clearly visible unlike a pure z-rotation.
         # Rodrigues' formula: r' = r cos θ + (u×r) sin θ + u(u·r)(1-cos θ)
-        theta = param * np.pi
-        ct, st = np.cos(theta), np.sin(theta)
-        s2 = 1 / np.sqrt(2)  # ux=0, uy=s2, uz=s2
-        dot = s2 * y + s2 * z                     # u · r
-        cx, cy, cz = s2*z - s2*y, s2*x, -s2*x    # u × r
-        new_x = ct * x + st * cx
-        new_y = ct * y + st * cy + (1 - ct) * s2 * dot
-        new_z = ct * z + st * cz + (1 - ct) * s2 * dot
+        # With ux=0, uy=uz=s2: u×r = s2·(z-y, x, -x) and u(u·r) = (0, 1, 1)·(y+z)/2
+        factors = _ROT_TABLE.get(param)
+        if factors is None:
+            factors = _rotation_factors(param)
+        ct, st = factors
+        sin_s2 = st * _S2
+        shift = y + z                             # u(u·r)(1-cos θ), shared by y and z
+        shift *= 0.5 * (1 - ct)
+        cross_x = sin_s2 * x
+        new_x = np.multiply(x, ct)
+        new_x += sin_s2 * (z - y)
+        new_y = np.multiply(y, ct)
+        new_y += cross_x
+        new_y += shift
+        new_z = np.multiply(z, ct)
+        new_z -= cross_x
+        new_z += shift
         return new_x, new_y, new_z
 
     elif noise_type == "decoherence":
@@ -153,7 +215,10 @@ def apply_noise(points, noise_type, param):
         # T1 effect
         new_z = (1 - gamma) * z + gamma  # drift toward +1
         # T2 effect (shrink x,y more aggressively, T2 < 2*T1)
-        t2_scale = np.sqrt(1 - gamma) * (1 - 0.5 * gamma)  # extra T2* contribution
+        sqrt_1m = _SQRT1M.get(gamma)
+        if sqrt_1m is None:
+            sqrt_1m = math.sqrt(1 - gamma)
+        t2_scale = sqrt_1m * (1 - 0.5 * gamma)  # extra T2* contribution
         new_x = t2_scale * x
         new_y = t2_scale * y
         return new_x, new_y, new_z
@@ -162,29 +227,11 @@ def apply_noise(points, noise_type, param):
 
 
 def generate_initial_states():
-    """Generate a set of pure states on the Bloch sphere."""
-    # Points on the sphere surface
-    n_phi = 12
-    n_theta = 8
-    phi = np.linspace(0, 2 * np.pi, n_phi, endpoint=False)
-    theta = np.linspace(0.2, np.pi - 0.2, n_theta)
+    """Return the shared set of pure states on the Bloch sphere."""
+    return _INIT_STATES
 
-    points_x, points_y, points_z = [], [], []
-    for t in theta:
-        for p in phi:
-            points_x.append(np.sin(t) * np.cos(p))
-            points_y.append(np.sin(t) * np.sin(p))
-            points_z.append(np.cos(t))
 
-    # Add poles
-    points_x.extend([0, 0])
-    points_y.extend([0, 0])
-    points_z.extend([1, -1])
-
-    return np.array(points_x), np.array(points_y), np.array(points_z)
-
-
-def generate_bloch_visualization(noise_id, noise_info):
+def generate_bloch_visualization(noise_id, noise_info, save_png=True):
     """Generate a multi-panel Bloch sphere visualization for a noise type."""
     fig = plt.figure(figsize=(14, 4))
     fig.suptitle(f"{noise_info['name']}: {noise_info['description']}", fontsize=14, y=0.98)
@@ -204,18 +251,16 @@ def generate_bloch_visualization(noise_id, noise_info):
         # Apply noise and plot transformed states
         new_x, new_y, new_z = apply_noise((init_x, init_y, init_z), effect, param)
 
-        # Color by initial z-coordinate for visual tracking
-        colors = plt.cm.RdYlBu((init_z + 1) / 2)
-
         # Plot initial states (faint)
-        ax.scatter(init_x, init_y, init_z, c='lightgray', s=20, alpha=0.3)
+        ax.scatter(init_x, init_y, init_z, c='lightgray', s=20, alpha=0.3, rasterized=True)
 
         # Plot transformed states
-        ax.scatter(new_x, new_y, new_z, c=colors, s=30, alpha=0.8, edgecolors='k', linewidths=0.3)
+        ax.scatter(new_x, new_y, new_z, c=_INIT_COLORS, s=30, alpha=0.8, edgecolors='k', linewidths=0.3,
+                   rasterized=True)
 
         # Draw arrows from initial to final position for a subset
-        for j in range(0, len(init_x), 8):
-            if param > 0:
+        if param > 0:
+            for j in range(0, len(init_x), 8):
                 ax.plot([init_x[j], new_x[j]], [init_y[j], new_y[j]], [init_z[j], new_z[j]],
                        'gray', alpha=0.3, linewidth=0.5)
 
@@ -247,18 +292,19 @@ def generate_bloch_visualization(noise_id, noise_info):
 
     # Save
     output_path = OUTPUT_DIR / f"{noise_id}.svg"
-    plt.savefig(output_path, format='svg', bbox_inches='tight', transparent=True)
+    plt.savefig(output_path, format='svg', dpi=150, bbox_inches='tight', transparent=True)
     print(f"  Saved: {output_path}")
 
-    # Also save PNG for broader compatibility
-    output_path_png = OUTPUT_DIR / f"{noise_id}.png"
-    plt.savefig(output_path_png, format='png', dpi=150, bbox_inches='tight', transparent=True)
-    print(f"  Saved: {output_path_png}")
+    # The site serves the PNG; it is a second full render, so --no-png can skip it
+    if save_png:
+        output_path_png = OUTPUT_DIR / f"{noise_id}.png"
+        plt.savefig(output_path_png, format='png', dpi=150, bbox_inches='tight', transparent=True)
+        print(f"  Saved: {output_path_png}")
 
-    plt.close()
+    plt.close(fig)
 
 
-def generate_summary_visualization():
+def generate_summary_visualization(save_png=True):
     """Generate a summary image showing all noise types side by side."""
     fig = plt.figure(figsize=(16, 10))
     fig.suptitle("Noise Effects on the Bloch Sphere", fontsize=16, y=0.98)
@@ -281,11 +327,9 @@ def generate_summary_visualization():
         effect = noise_info['effect']
         new_x, new_y, new_z = apply_noise((init_x, init_y, init_z), effect, param)
 
-        # Color by initial z-coordinate
-        colors = plt.cm.RdYlBu((init_z + 1) / 2)
-
         # Plot transformed states
-        ax.scatter(new_x, new_y, new_z, c=colors, s=25, alpha=0.8, edgecolors='k', linewidths=0.3)
+        ax.scatter(new_x, new_y, new_z, c=_INIT_COLORS, s=25, alpha=0.8, edgecolors='k', linewidths=0.3,
+                   rasterized=True)
 
         # Settings
         ax.set_xlim([-1.3, 1.3])
@@ -307,29 +351,40 @@ def generate_summary_visualization():
     plt.tight_layout()
 
     output_path = OUTPUT_DIR / "noise-summary.svg"
-    plt.savefig(output_path, format='svg', bbox_inches='tight', transparent=True)
+    plt.savefig(output_path, format='svg', dpi=150, bbox_inches='tight', transparent=True)
     print(f"  Saved: {output_path}")
 
-    output_path_png = OUTPUT_DIR / "noise-summary.png"
-    plt.savefig(output_path_png, format='png', dpi=150, bbox_inches='tight', transparent=True)
-    print(f"  Saved: {output_path_png}")
+    if save_png:
+        output_path_png = OUTPUT_DIR / "noise-summary.png"
+        plt.savefig(output_path_png, format='png', dpi=150, bbox_inches='tight', transparent=True)
+        print(f"  Saved: {output_path_png}")
 
-    plt.close()
+    plt.close(fig)
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--no-png", dest="save_png", action="store_false",
+                        help="write only the SVGs, leaving the PNGs the site serves untouched")
+    args = parser.parse_args()
+
     print("Generating Bloch sphere visualizations...")
     print(f"Output directory: {OUTPUT_DIR}")
     print()
 
-    # Generate individual noise type visualizations
-    for noise_id, noise_info in NOISE_TYPES.items():
-        print(f"Generating {noise_info['name']}...")
-        generate_bloch_visualization(noise_id, noise_info)
+    # Every figure is independent, so render them in parallel across cores
+    with ProcessPoolExecutor() as executor:
+        futures = []
+        for noise_id, noise_info in NOISE_TYPES.items():
+            print(f"Generating {noise_info['name']}...")
+            futures.append(executor.submit(generate_bloch_visualization,
+                                           noise_id, noise_info, save_png=args.save_png))
+
+        print("Generating summary visualization...")
+        futures.append(executor.submit(generate_summary_visualization, save_png=args.save_png))
 
-    # Generate summary visualization
-    print("\nGenerating summary visualization...")
-    generate_summary_visualization()
+        for future in futures:
+            future.result()
 
     print("\nDone!")
 
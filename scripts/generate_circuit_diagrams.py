@@ -23,6 +23,8 @@ OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 def save_circuit(circuit, filename, title=None):
     """Save a circuit diagram as SVG."""
+    import matplotlib
+    matplotlib.use("Agg")  # headless: files only, never a GUI window
     import matplotlib.pyplot as plt
     from qiskit.visualization import circuit_drawer
 
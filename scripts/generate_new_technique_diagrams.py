@@ -1,59 +1,82 @@
 #!/usr/bin/env python3
 """Generate workflow diagrams for new QEM techniques."""
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import numpy as np
-
-# Helper functions
-def draw_box(ax, x, y, width, height, text, color='#3498db', text_color='white', fontsize=10):
-    rect = mpatches.FancyBboxPatch((x, y), width, height,
-                                    boxstyle="round,pad=0.05,rounding_size=0.2",
-                                    facecolor=color, edgecolor='black', linewidth=2)
-    ax.add_patch(rect)
-    ax.text(x + width/2, y + height/2, text, ha='center', va='center',
-            fontsize=fontsize, fontweight='bold', color=text_color, wrap=True)
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
-def draw_arrow(ax, start, end, color='black'):
-    ax.annotate('', xy=end, xytext=start,
-                arrowprops=dict(arrowstyle='->', color=color, lw=2))
+import numpy as np
+from matplotlib.figure import Figure
+
+import workflow_shapes
+from figure_io import is_current, save_stamped, source_hash
+from workflow_shapes import add_box_collection, draw_arrow, draw_box
+
+OUTPUT_DIR = Path(__file__).parent.parent / "images" / "techniques"
+SRC_HASH = source_hash(__file__, workflow_shapes.__file__)
+
+# Callout bbox styles, shared by every ax.text that uses them
+_BBOX_GREEN = dict(boxstyle='round', facecolor='#e8f8f5', edgecolor='#27ae60')
+_BBOX_BLUE = dict(boxstyle='round', facecolor='#ebf5fb', edgecolor='#3498db')
+_BBOX_RED = dict(boxstyle='round', facecolor='#fadbd8', edgecolor='#e74c3c')
+_BBOX_DARK = dict(boxstyle='round', facecolor='#f5f5f5', edgecolor='#2c3e50')
+
+# One figure is reused for every diagram; _new_diagram clears it in between
+_FIG = None
+_AX = None
+
+def _new_diagram(figsize, ylim, title):
+    """Reset the shared figure to a blank diagram canvas and return (fig, ax)."""
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG = Figure(figsize=figsize, layout='constrained')
+        _AX = _FIG.subplots()
+    else:
+        _AX.clear()
+        _FIG.set_size_inches(figsize)
+    _AX.set_xlim(0, 14)
+    _AX.set_ylim(0, ylim)
+    _AX.axis('off')
+    _AX.set_title(title, fontsize=16, fontweight='bold', pad=20)
+    return _FIG, _AX
 
 # ============================================
 # 1. ML-QEM Workflow
 # ============================================
 def generate_ml_qem_diagram():
-    fig, ax = plt.subplots(figsize=(14, 8))
-    ax.set_xlim(0, 14)
-    ax.set_ylim(0, 9)
-    ax.axis('off')
-    ax.set_title('Machine Learning QEM Workflow', fontsize=16, fontweight='bold', pad=20)
+    png_path = OUTPUT_DIR / 'ml-qem-workflow.png'
+    svg_path = png_path.with_suffix('.svg')
+    if is_current(SRC_HASH, png_path, svg_path):
+        return
+
+    fig, ax = _new_diagram((14, 8), 9, 'Machine Learning QEM Workflow')
+    boxes = []  # drawn together by add_box_collection
 
     # Training phase (top)
     ax.text(4, 8.3, 'Training Phase', fontsize=12, fontweight='bold', color='#2c3e50')
 
     # Near-Clifford circuits
-    draw_box(ax, 0.5, 6.5, 2.5, 1.2, 'Near-Clifford\nCircuits', '#9b59b6')
+    draw_box(ax, boxes, 0.5, 6.5, 2.5, 1.2, 'Near-Clifford\nCircuits', '#9b59b6')
 
     # Classical simulation
-    draw_box(ax, 0.5, 4.8, 2.5, 1.2, 'Classical\nSimulation', '#27ae60')
+    draw_box(ax, boxes, 0.5, 4.8, 2.5, 1.2, 'Classical\nSimulation', '#27ae60')
     draw_arrow(ax, (1.75, 6.5), (1.75, 6))
     ax.text(2, 6.2, 'Ideal\nvalues', fontsize=8, color='#27ae60')
 
     # Quantum execution
-    draw_box(ax, 3.5, 6.5, 2.5, 1.2, 'Quantum\nExecution', '#e74c3c')
+    draw_box(ax, boxes, 3.5, 6.5, 2.5, 1.2, 'Quantum\nExecution', '#e74c3c')
     draw_arrow(ax, (3, 7.1), (3.5, 7.1))
 
     # Noisy outputs
-    draw_box(ax, 3.5, 4.8, 2.5, 1.2, 'Noisy\nOutputs', '#e74c3c')
+    draw_box(ax, boxes, 3.5, 4.8, 2.5, 1.2, 'Noisy\nOutputs', '#e74c3c')
     draw_arrow(ax, (4.75, 6.5), (4.75, 6))
 
     # Training data
-    draw_box(ax, 2, 3.2, 3, 1.2, 'Training Data\n(features, noisy, ideal)', '#34495e')
+    draw_box(ax, boxes, 2, 3.2, 3, 1.2, 'Training Data\n(features, noisy, ideal)', '#34495e')
     draw_arrow(ax, (1.75, 4.8), (2.5, 4.4))
     draw_arrow(ax, (4.75, 4.8), (4.5, 4.4))
 
     # ML Model
-    draw_box(ax, 6.5, 3.2, 2.5, 1.2, 'ML Model\n(RF, NN, GNN)', '#3498db')
+    draw_box(ax, boxes, 6.5, 3.2, 2.5, 1.2, 'ML Model\n(RF, NN, GNN)', '#3498db')
     draw_arrow(ax, (5, 3.8), (6.5, 3.8))
     ax.text(5.5, 4.1, 'Train', fontsize=9, color='#3498db')
 
@@ -61,10 +84,10 @@ def generate_ml_qem_diagram():
     ax.text(10, 8.3, 'Inference Phase', fontsize=12, fontweight='bold', color='#2c3e50')
 
     # Target circuit
-    draw_box(ax, 9.5, 6.5, 2.5, 1.2, 'Target\nCircuit', '#2c3e50')
+    draw_box(ax, boxes, 9.5, 6.5, 2.5, 1.2, 'Target\nCircuit', '#2c3e50')
 
     # Noisy execution
-    draw_box(ax, 9.5, 4.8, 2.5, 1.2, 'Noisy\nExecution', '#e74c3c')
+    draw_box(ax, boxes, 9.5, 4.8, 2.5, 1.2, 'Noisy\nExecution', '#e74c3c')
     draw_arrow(ax, (10.75, 6.5), (10.75, 6))
 
     # Apply model
@@ -72,156 +95,156 @@ def generate_ml_qem_diagram():
     draw_arrow(ax, (10.75, 4.8), (10.75, 2.4))
 
     # Mitigated output
-    draw_box(ax, 9.5, 1.2, 2.5, 1.2, 'Error-Mitigated\nEstimate', '#27ae60')
+    draw_box(ax, boxes, 9.5, 1.2, 2.5, 1.2, 'Error-Mitigated\nEstimate', '#27ae60')
 
     # Annotations
     ax.text(0.5, 2.5, '2x+ faster\nthan ZNE', fontsize=10, color='#27ae60',
-            bbox=dict(boxstyle='round', facecolor='#e8f8f5', edgecolor='#27ae60'))
+            bbox=_BBOX_GREEN)
     ax.text(0.5, 1.2, 'No explicit\nnoise model', fontsize=10, color='#3498db',
-            bbox=dict(boxstyle='round', facecolor='#ebf5fb', edgecolor='#3498db'))
+            bbox=_BBOX_BLUE)
 
-    plt.tight_layout()
-    plt.savefig('images/techniques/ml-qem-workflow.png', dpi=150, bbox_inches='tight', facecolor='white')
-    plt.savefig('images/techniques/ml-qem-workflow.svg', bbox_inches='tight', facecolor='white')
-    plt.close()
+    add_box_collection(ax, boxes)
+    save_stamped(fig, SRC_HASH, png_path, svg_path)
     print("ML-QEM workflow diagram saved!")
 
 # ============================================
 # 2. GSE Workflow
 # ============================================
 def generate_gse_diagram():
-    fig, ax = plt.subplots(figsize=(14, 8))
-    ax.set_xlim(0, 14)
-    ax.set_ylim(0, 9)
-    ax.axis('off')
-    ax.set_title('Generalized Subspace Expansion (GSE)', fontsize=16, fontweight='bold', pad=20)
+    png_path = OUTPUT_DIR / 'gse-workflow.png'
+    svg_path = png_path.with_suffix('.svg')
+    if is_current(SRC_HASH, png_path, svg_path):
+        return
+
+    fig, ax = _new_diagram((14, 8), 9, 'Generalized Subspace Expansion (GSE)')
+    boxes = []  # drawn together by add_box_collection
 
     # Noisy state
-    draw_box(ax, 0.5, 6.5, 2, 1.2, 'Noisy State\nρ', '#e74c3c')
+    draw_box(ax, boxes, 0.5, 6.5, 2, 1.2, 'Noisy State\nρ', '#e74c3c')
 
     # Power subspace construction
     draw_arrow(ax, (2.5, 7.1), (3.2, 7.1))
 
     # Powers of rho
-    draw_box(ax, 3.2, 7.2, 1.5, 0.8, 'ρ', '#3498db')
-    draw_box(ax, 4.9, 7.2, 1.5, 0.8, 'ρ²', '#3498db')
-    draw_box(ax, 6.6, 7.2, 1.5, 0.8, 'ρ³', '#3498db')
+    draw_box(ax, boxes, 3.2, 7.2, 1.5, 0.8, 'ρ', '#3498db')
+    draw_box(ax, boxes, 4.9, 7.2, 1.5, 0.8, 'ρ²', '#3498db')
+    draw_box(ax, boxes, 6.6, 7.2, 1.5, 0.8, 'ρ³', '#3498db')
     ax.text(8.3, 7.5, '...', fontsize=14, fontweight='bold')
-    draw_box(ax, 8.8, 7.2, 1.5, 0.8, 'ρᵐ', '#3498db')
+    draw_box(ax, boxes, 8.8, 7.2, 1.5, 0.8, 'ρᵐ', '#3498db')
 
     ax.text(6, 8.3, 'Expanded Subspace (Power Basis)', fontsize=11, fontweight='bold', color='#3498db', ha='center')
 
     # Alternative: error-boosted
     ax.text(6, 5.8, 'OR', fontsize=12, fontweight='bold', color='#7f8c8d', ha='center')
 
-    draw_box(ax, 3.2, 4.8, 1.5, 0.8, 'ρ_λ₁', '#9b59b6')
-    draw_box(ax, 4.9, 4.8, 1.5, 0.8, 'ρ_λ₂', '#9b59b6')
-    draw_box(ax, 6.6, 4.8, 1.5, 0.8, 'ρ_λ₃', '#9b59b6')
+    draw_box(ax, boxes, 3.2, 4.8, 1.5, 0.8, 'ρ_λ₁', '#9b59b6')
+    draw_box(ax, boxes, 4.9, 4.8, 1.5, 0.8, 'ρ_λ₂', '#9b59b6')
+    draw_box(ax, boxes, 6.6, 4.8, 1.5, 0.8, 'ρ_λ₃', '#9b59b6')
     ax.text(8.3, 5.1, '...', fontsize=14, fontweight='bold')
-    draw_box(ax, 8.8, 4.8, 1.5, 0.8, 'ρ_λₖ', '#9b59b6')
+    draw_box(ax, boxes, 8.8, 4.8, 1.5, 0.8, 'ρ_λₖ', '#9b59b6')
 
     ax.text(6, 4.4, 'Error-Boosted States (Noise-Scaled)', fontsize=11, fontweight='bold', color='#9b59b6', ha='center')
 
     # Measure matrix elements
     draw_arrow(ax, (6, 4.8), (6, 3.8))
-    draw_box(ax, 4, 2.5, 4, 1.2, 'Measure H_ij and S_ij\nin expanded basis', '#34495e')
+    draw_box(ax, boxes, 4, 2.5, 4, 1.2, 'Measure H_ij and S_ij\nin expanded basis', '#34495e')
 
     # Solve eigenvalue problem
     draw_arrow(ax, (6, 2.5), (6, 1.7))
-    draw_box(ax, 4, 0.5, 4, 1.2, 'Solve Hc = ESc\n(Gen. Eigenvalue)', '#27ae60')
+    draw_box(ax, boxes, 4, 0.5, 4, 1.2, 'Solve Hc = ESc\n(Gen. Eigenvalue)', '#27ae60')
 
     # Output
     draw_arrow(ax, (8, 1.1), (9.5, 1.1))
-    draw_box(ax, 9.5, 0.5, 3.5, 1.2, 'Error-Mitigated\nEnergy E', '#27ae60')
+    draw_box(ax, boxes, 9.5, 0.5, 3.5, 1.2, 'Error-Mitigated\nEnergy E', '#27ae60')
 
     # Annotations
     ax.text(10.5, 3, 'Unifies QSE +\nVirtual Distillation', fontsize=9, color='#2c3e50',
-            bbox=dict(boxstyle='round', facecolor='#f5f5f5', edgecolor='#2c3e50'))
+            bbox=_BBOX_DARK)
     ax.text(10.5, 2, 'Handles coherent +\nstochastic + algorithmic', fontsize=9, color='#27ae60',
-            bbox=dict(boxstyle='round', facecolor='#e8f8f5', edgecolor='#27ae60'))
+            bbox=_BBOX_GREEN)
 
-    plt.tight_layout()
-    plt.savefig('images/techniques/gse-workflow.png', dpi=150, bbox_inches='tight', facecolor='white')
-    plt.savefig('images/techniques/gse-workflow.svg', bbox_inches='tight', facecolor='white')
-    plt.close()
+    add_box_collection(ax, boxes)
+    save_stamped(fig, SRC_HASH, png_path, svg_path)
     print("GSE workflow diagram saved!")
 
 # ============================================
 # 3. Pseudo Twirling Workflow
 # ============================================
 def generate_pseudo_twirling_diagram():
-    fig, ax = plt.subplots(figsize=(14, 7))
-    ax.set_xlim(0, 14)
-    ax.set_ylim(0, 8)
-    ax.axis('off')
-    ax.set_title('Pseudo Twirling for Non-Clifford Gates', fontsize=16, fontweight='bold', pad=20)
+    png_path = OUTPUT_DIR / 'pseudo-twirling-workflow.png'
+    svg_path = png_path.with_suffix('.svg')
+    if is_current(SRC_HASH, png_path, svg_path):
+        return
+
+    fig, ax = _new_diagram((14, 7), 8, 'Pseudo Twirling for Non-Clifford Gates')
+    boxes = []  # drawn together by add_box_collection
 
     # Non-Clifford gate
-    draw_box(ax, 0.5, 5, 2.5, 1.5, 'Non-Clifford\nGate G\n(e.g., partial CZ)', '#e74c3c')
+    draw_box(ax, boxes, 0.5, 5, 2.5, 1.5, 'Non-Clifford\nGate G\n(e.g., partial CZ)', '#e74c3c')
 
     # Problem annotation
     ax.text(0.5, 4.3, 'Pauli twirling\nfails here!', fontsize=9, color='#e74c3c',
-            bbox=dict(boxstyle='round', facecolor='#fadbd8', edgecolor='#e74c3c'))
+            bbox=_BBOX_RED)
 
     # Arrow to pseudo twirling
     draw_arrow(ax, (3, 5.75), (4, 5.75))
 
     # Pseudo twirling box
-    draw_box(ax, 4, 4.5, 3.5, 2.5, 'Pseudo Twirling\n\nQ·G·P ≈ G + O(ε)\n\nApproximate\ncommutation', '#3498db')
+    draw_box(ax, boxes, 4, 4.5, 3.5, 2.5, 'Pseudo Twirling\n\nQ·G·P ≈ G + O(ε)\n\nApproximate\ncommutation', '#3498db')
 
     # Multiple randomizations
     draw_arrow(ax, (7.5, 5.75), (8.5, 6.5))
     draw_arrow(ax, (7.5, 5.75), (8.5, 5.75))
     draw_arrow(ax, (7.5, 5.75), (8.5, 5))
 
-    draw_box(ax, 8.5, 6, 2.5, 1, 'Q₁·G·P₁', '#9b59b6')
-    draw_box(ax, 8.5, 4.8, 2.5, 1, 'Q₂·G·P₂', '#9b59b6')
-    draw_box(ax, 8.5, 3.6, 2.5, 1, 'Q₃·G·P₃', '#9b59b6')
+    draw_box(ax, boxes, 8.5, 6, 2.5, 1, 'Q₁·G·P₁', '#9b59b6')
+    draw_box(ax, boxes, 8.5, 4.8, 2.5, 1, 'Q₂·G·P₂', '#9b59b6')
+    draw_box(ax, boxes, 8.5, 3.6, 2.5, 1, 'Q₃·G·P₃', '#9b59b6')
     ax.text(9.75, 3.2, '...', fontsize=14, fontweight='bold', ha='center')
 
     # Average
     draw_arrow(ax, (11, 5.2), (11.5, 5.2))
-    draw_box(ax, 11.5, 4.5, 2, 1.5, 'Average\nResults', '#27ae60')
+    draw_box(ax, boxes, 11.5, 4.5, 2, 1.5, 'Average\nResults', '#27ae60')
 
     # Result annotation
     draw_arrow(ax, (12.5, 4.5), (12.5, 3))
     ax.text(11, 2.5, 'Coherent → Quasi-Stochastic', fontsize=10, fontweight='bold', color='#27ae60',
-            bbox=dict(boxstyle='round', facecolor='#e8f8f5', edgecolor='#27ae60'))
+            bbox=_BBOX_GREEN)
 
     # Combined with KIK
     ax.text(0.5, 1.5, 'Can combine with KIK:', fontsize=10, fontweight='bold', color='#2c3e50')
-    draw_box(ax, 0.5, 0.3, 3, 1, 'Pseudo Twirling\n(coherent)', '#3498db')
+    draw_box(ax, boxes, 0.5, 0.3, 3, 1, 'Pseudo Twirling\n(coherent)', '#3498db')
     ax.text(3.7, 0.8, '+', fontsize=14, fontweight='bold')
-    draw_box(ax, 4, 0.3, 3, 1, 'Adaptive KIK\n(incoherent)', '#9b59b6')
+    draw_box(ax, boxes, 4, 0.3, 3, 1, 'Adaptive KIK\n(incoherent)', '#9b59b6')
     ax.text(7.2, 0.8, '=', fontsize=14, fontweight='bold')
-    draw_box(ax, 7.5, 0.3, 3.5, 1, 'Full Error\nMitigation', '#27ae60')
+    draw_box(ax, boxes, 7.5, 0.3, 3.5, 1, 'Full Error\nMitigation', '#27ae60')
 
-    plt.tight_layout()
-    plt.savefig('images/techniques/pseudo-twirling-workflow.png', dpi=150, bbox_inches='tight', facecolor='white')
-    plt.savefig('images/techniques/pseudo-twirling-workflow.svg', bbox_inches='tight', facecolor='white')
-    plt.close()
+    add_box_collection(ax, boxes)
+    save_stamped(fig, SRC_HASH, png_path, svg_path)
     print("Pseudo twirling workflow diagram saved!")
 
 # ============================================
 # 4. Symmetric Clifford Twirling Workflow
 # ============================================
 def generate_symmetric_clifford_twirling_diagram():
-    fig, ax = plt.subplots(figsize=(14, 7))
-    ax.set_xlim(0, 14)
-    ax.set_ylim(0, 8)
-    ax.axis('off')
-    ax.set_title('Symmetric Clifford Twirling', fontsize=16, fontweight='bold', pad=20)
+    png_path = OUTPUT_DIR / 'symmetric-clifford-twirling-workflow.png'
+    svg_path = png_path.with_suffix('.svg')
+    if is_current(SRC_HASH, png_path, svg_path):
+        return
+
+    fig, ax = _new_diagram((14, 7), 8, 'Symmetric Clifford Twirling')
+    boxes = []  # drawn together by add_box_collection
 
     # Target operation with symmetry
-    draw_box(ax, 0.5, 5.5, 2.5, 1.5, 'Target Op\nwith symmetry\n[G, P] = 0', '#2c3e50')
+    draw_box(ax, boxes, 0.5, 5.5, 2.5, 1.5, 'Target Op\nwith symmetry\n[G, P] = 0', '#2c3e50')
 
     # Identify symmetric Cliffords
     draw_arrow(ax, (3, 6.25), (4, 6.25))
-    draw_box(ax, 4, 5.5, 3, 1.5, 'Symmetric Cliffords\nC in Cliff_sym\n[C, P] = 0', '#3498db')
+    draw_box(ax, boxes, 4, 5.5, 3, 1.5, 'Symmetric Cliffords\nC in Cliff_sym\n[C, P] = 0', '#3498db')
 
     # Apply twirling
     draw_arrow(ax, (7, 6.25), (8, 6.25))
-    draw_box(ax, 8, 5.5, 3, 1.5, 'Apply\nC_L · G · C_R', '#9b59b6')
+    draw_box(ax, boxes, 8, 5.5, 3, 1.5, 'Apply\nC_L · G · C_R', '#9b59b6')
 
     # Multiple instances
     draw_arrow(ax, (11, 6.25), (11.5, 6.25))
@@ -234,62 +257,59 @@ def generate_symmetric_clifford_twirling_diagram():
 
     # Average to white noise
     draw_arrow(ax, (12.5, 3.5), (12.5, 2.5))
-    draw_box(ax, 10.5, 1, 3, 1.3, '≈ Global White\nNoise + O(e⁻ⁿ)', '#27ae60')
+    draw_box(ax, boxes, 10.5, 1, 3, 1.3, '≈ Global White\nNoise + O(e⁻ⁿ)', '#27ae60')
 
     # Structure preserved
     ax.text(0.5, 3.5, 'Key insight:', fontsize=10, fontweight='bold', color='#2c3e50')
     ax.text(0.5, 2.8, 'Only use Cliffords that\ncommute with symmetry', fontsize=9, color='#3498db',
-            bbox=dict(boxstyle='round', facecolor='#ebf5fb', edgecolor='#3498db'))
+            bbox=_BBOX_BLUE)
     ax.text(0.5, 1.5, 'Structure preserved +\nNoise scrambled', fontsize=9, color='#27ae60',
-            bbox=dict(boxstyle='round', facecolor='#e8f8f5', edgecolor='#27ae60'))
-
-    # Fix the formula to use plain text
-    ax.patches[-1]  # reference last box
+            bbox=_BBOX_GREEN)
 
     # Hardware efficient variant
-    draw_box(ax, 4.5, 1, 4, 1.3, 'Hardware-efficient:\nLocal symmetric Cliffords', '#f39c12')
+    draw_box(ax, boxes, 4.5, 1, 4, 1.3, 'Hardware-efficient:\nLocal symmetric Cliffords', '#f39c12')
     ax.text(4.5, 0.3, 'Reduces gate overhead', fontsize=9, color='#f39c12')
 
-    plt.tight_layout()
-    plt.savefig('images/techniques/symmetric-clifford-twirling-workflow.png', dpi=150, bbox_inches='tight', facecolor='white')
-    plt.savefig('images/techniques/symmetric-clifford-twirling-workflow.svg', bbox_inches='tight', facecolor='white')
-    plt.close()
+    add_box_collection(ax, boxes)
+    save_stamped(fig, SRC_HASH, png_path, svg_path)
     print("Symmetric Clifford twirling workflow diagram saved!")
 
 # ============================================
 # 5. Sparse Pauli-Lindblad Workflow
 # ============================================
 def generate_sparse_pauli_lindblad_diagram():
-    fig, ax = plt.subplots(figsize=(14, 8))
-    ax.set_xlim(0, 14)
-    ax.set_ylim(0, 9)
-    ax.axis('off')
-    ax.set_title('Sparse Pauli-Lindblad Noise Learning', fontsize=16, fontweight='bold', pad=20)
+    png_path = OUTPUT_DIR / 'sparse-pauli-lindblad-workflow.png'
+    svg_path = png_path.with_suffix('.svg')
+    if is_current(SRC_HASH, png_path, svg_path):
+        return
+
+    fig, ax = _new_diagram((14, 8), 9, 'Sparse Pauli-Lindblad Noise Learning')
+    boxes = []  # drawn together by add_box_collection
 
     # Calibration circuits
-    draw_box(ax, 0.5, 6.5, 2.5, 1.5, 'Calibration\nCircuits\n(per layer)', '#9b59b6')
+    draw_box(ax, boxes, 0.5, 6.5, 2.5, 1.5, 'Calibration\nCircuits\n(per layer)', '#9b59b6')
 
     # Execute on hardware
     draw_arrow(ax, (3, 7.25), (4, 7.25))
-    draw_box(ax, 4, 6.5, 2.5, 1.5, 'Execute on\nQuantum\nHardware', '#e74c3c')
+    draw_box(ax, boxes, 4, 6.5, 2.5, 1.5, 'Execute on\nQuantum\nHardware', '#e74c3c')
 
     # Fit sparse model
     draw_arrow(ax, (6.5, 7.25), (7.5, 7.25))
-    draw_box(ax, 7.5, 6.2, 4, 2, 'Fit Sparse Pauli-Lindblad\n\nℒ(ρ) = Σᵢ λᵢ(PᵢρPᵢ - ρ)\n\nLow-weight, local Paulis', '#3498db')
+    draw_box(ax, boxes, 7.5, 6.2, 4, 2, 'Fit Sparse Pauli-Lindblad\n\nℒ(ρ) = Σᵢ λᵢ(PᵢρPᵢ - ρ)\n\nLow-weight, local Paulis', '#3498db')
 
     # Two uses
     draw_arrow(ax, (9.5, 6.2), (8, 5))
     draw_arrow(ax, (9.5, 6.2), (11, 5))
 
     # PEC path
-    draw_box(ax, 6.5, 3.5, 3, 1.3, 'Invert for PEC\nN^-1 = exp(-L)', '#27ae60')
+    draw_box(ax, boxes, 6.5, 3.5, 3, 1.3, 'Invert for PEC\nN^-1 = exp(-L)', '#27ae60')
     draw_arrow(ax, (8, 3.5), (8, 2.2))
-    draw_box(ax, 6.5, 1, 3, 1.2, 'Scalable\nPEC', '#27ae60')
+    draw_box(ax, boxes, 6.5, 1, 3, 1.2, 'Scalable\nPEC', '#27ae60')
 
     # PEA path
-    draw_box(ax, 10, 3.5, 3, 1.3, 'Amplify for ZNE\nInject cλᵢ noise', '#f39c12')
+    draw_box(ax, boxes, 10, 3.5, 3, 1.3, 'Amplify for ZNE\nInject cλᵢ noise', '#f39c12')
     draw_arrow(ax, (11.5, 3.5), (11.5, 2.2))
-    draw_box(ax, 10, 1, 3, 1.2, 'Accurate\nPEA/ZNE', '#f39c12')
+    draw_box(ax, boxes, 10, 1, 3, 1.2, 'Accurate\nPEA/ZNE', '#f39c12')
 
     # Scalability note
     ax.text(0.5, 4, 'Key Properties:', fontsize=10, fontweight='bold', color='#2c3e50')
@@ -301,18 +321,26 @@ def generate_sparse_pauli_lindblad_diagram():
     # Formula box
     ax.text(1, 5.5, 'Sparsity: weight(Pᵢ) ≤ 2\nLocality: neighboring qubits',
             fontsize=9, color='#3498db',
-            bbox=dict(boxstyle='round', facecolor='#ebf5fb', edgecolor='#3498db'))
+            bbox=_BBOX_BLUE)
 
-    plt.tight_layout()
-    plt.savefig('images/techniques/sparse-pauli-lindblad-workflow.png', dpi=150, bbox_inches='tight', facecolor='white')
-    plt.savefig('images/techniques/sparse-pauli-lindblad-workflow.svg', bbox_inches='tight', facecolor='white')
-    plt.close()
+    add_box_collection(ax, boxes)
+    save_stamped(fig, SRC_HASH, png_path, svg_path)
     print("Sparse Pauli-Lindblad workflow diagram saved!")
 
-if __name__ == "__main__":
-    generate_ml_qem_diagram()
-    generate_gse_diagram()
-    generate_pseudo_twirling_diagram()
-    generate_symmetric_clifford_twirling_diagram()
-    generate_sparse_pauli_lindblad_diagram()
+
+def submit_figures(executor):
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    return [executor.submit(generate) for generate in (
+        generate_ml_qem_diagram, generate_gse_diagram, generate_pseudo_twirling_diagram,
+        generate_symmetric_clifford_twirling_diagram, generate_sparse_pauli_lindblad_diagram)]
+
+
+def main():
+    with ProcessPoolExecutor() as executor:
+        for future in submit_figures(executor):
+            future.result()
     print("\nAll diagrams generated!")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,33 @@
 #!/usr/bin/env python3
 """Generate noise type diagrams: leakage energy levels and crosstalk triangle."""
 
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
 import matplotlib.patches as patches
 import numpy as np
+from matplotlib.collections import PatchCollection
+from matplotlib.figure import Figure
+
+from figure_io import is_current, save_stamped, source_hash
 
-# Set up consistent styling
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.size'] = 14
-plt.rcParams['mathtext.fontset'] = 'stix'
+OUTPUT_DIR = Path(__file__).parent.parent / "assets" / "noise"
+SRC_HASH = source_hash(__file__)
+
+# Math labels use the STIX fonts; set per Text so the global rc is left alone
+MATH_FONT = 'stix'
 
 
 def create_leakage_diagram(output_path: str):
     """Create an energy level diagram showing leakage to higher states."""
-    fig, ax = plt.subplots(figsize=(6, 5))
+    if is_current(SRC_HASH, output_path):
+        return
+
+    fig = Figure(figsize=(6, 2.5), layout='constrained')
+    ax = fig.subplots()
 
     # Draw the potential well (parabola)
-    x = np.linspace(-2, 2, 100)
+    x = np.linspace(-2, 2, 40)
     y = 0.3 * x**2
     ax.plot(x, y, 'k-', linewidth=2)
 
@@ -30,26 +41,32 @@ def create_leakage_diagram(output_path: str):
     level_width = 1.2
     for y_pos, label in levels:
         ax.hlines(y_pos, -level_width/2, level_width/2, colors='k', linewidth=2.5)
-        ax.text(level_width/2 + 0.15, y_pos, label, fontsize=16, va='center')
+        ax.text(level_width/2 + 0.15, y_pos, label, fontsize=16, va='center',
+                math_fontfamily=MATH_FONT)
 
     # Transition arrows and labels
     arrow_x = -0.35
-    arrow_props = dict(arrowstyle='<->', color='black', lw=1.5)
+    # Annotation arrow heads scale with the font size, so pin it explicitly
+    arrow_props = dict(arrowstyle='<->', color='black', lw=1.5, mutation_scale=14)
 
     # ω₀₁ transition (computational subspace)
     ax.annotate('', xy=(arrow_x, 0.3), xytext=(arrow_x, 0.6),
                 arrowprops=arrow_props)
-    ax.text(arrow_x - 0.15, 0.45, r'$\omega_{01}$', fontsize=14, ha='right', va='center')
+    ax.text(arrow_x - 0.15, 0.45, r'$\omega_{01}$', fontsize=14, ha='right', va='center',
+            math_fontfamily=MATH_FONT)
 
     # ω₁₂ transition (leakage)
     ax.annotate('', xy=(arrow_x, 0.6), xytext=(arrow_x, 1.0),
                 arrowprops=arrow_props)
-    ax.text(arrow_x - 0.15, 0.8, r'$\omega_{12} \neq \omega_{01}$', fontsize=12, ha='right', va='center')
+    ax.text(arrow_x - 0.15, 0.8, r'$\omega_{12} \neq \omega_{01}$', fontsize=12, ha='right', va='center',
+            math_fontfamily=MATH_FONT)
 
     # ω₂₃ transition hint (even higher leakage)
     ax.annotate('', xy=(arrow_x, 1.0), xytext=(arrow_x, 1.25),
-                arrowprops=dict(arrowstyle='->', color='black', lw=1.5, ls='--'))
-    ax.text(arrow_x - 0.15, 1.12, r'$\omega_{23} \neq \omega_{01}$', fontsize=12, ha='right', va='center')
+                arrowprops=dict(arrowstyle='->', color='black', lw=1.5, ls='--',
+                                mutation_scale=14))
+    ax.text(arrow_x - 0.15, 1.12, r'$\omega_{23} \neq \omega_{01}$', fontsize=12, ha='right', va='center',
+            math_fontfamily=MATH_FONT)
 
     # Title
     ax.set_title('Leakage', fontsize=18, fontweight='bold', pad=15)
@@ -60,41 +77,38 @@ def create_leakage_diagram(output_path: str):
     ax.set_aspect('equal')
     ax.axis('off')
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    save_stamped(fig, SRC_HASH, output_path)
     print(f"Created: {output_path}")
 
 
 def create_crosstalk_diagram(output_path: str):
     """Create a triangle diagram showing crosstalk between three qubits."""
-    fig, ax = plt.subplots(figsize=(3.5, 3.5))
+    if is_current(SRC_HASH, output_path):
+        return
 
-    # Triangle vertices (equilateral, pointing up)
-    angle_offset = np.pi / 2  # Start from top
-    angles = [angle_offset + i * 2 * np.pi / 3 for i in range(3)]
-    radius = 1.0
+    fig = Figure(figsize=(3.5, 3.5), layout='constrained')
+    ax = fig.subplots()
 
-    vertices = [(radius * np.cos(a), radius * np.sin(a)) for a in angles]
+    # Triangle vertices (equilateral, pointing up, circumradius 1)
+    half_side = np.sqrt(3) / 2
+    vertices = np.array([(0.0, 1.0), (-half_side, -0.5), (half_side, -0.5)])
 
-    # Draw triangle edges
+    # Draw triangle edges as one closed polyline
     triangle_color = '#1a237e'  # Dark blue
-    for i in range(3):
-        x1, y1 = vertices[i]
-        x2, y2 = vertices[(i + 1) % 3]
-        ax.plot([x1, x2], [y1, y2], color=triangle_color, linewidth=3, zorder=1)
+    outline = np.vstack([vertices, vertices[:1]])
+    ax.plot(outline[:, 0], outline[:, 1], color=triangle_color, linewidth=3, zorder=1)
 
     # Draw qubit circles
     qubit_color = '#1a237e'
     qubit_radius = 0.25
     labels = [r'$Q_0$', r'$Q_1$', r'$Q_2$']
 
+    circles = [patches.Circle((x, y), qubit_radius) for x, y in vertices]
+    ax.add_collection(PatchCollection(circles, facecolors=qubit_color, edgecolors=qubit_color,
+                                      zorder=2))
     for i, (x, y) in enumerate(vertices):
-        circle = plt.Circle((x, y), qubit_radius, color=qubit_color, zorder=2)
-        ax.add_patch(circle)
         ax.text(x, y, labels[i], color='white', fontsize=16, fontweight='bold',
-                ha='center', va='center', zorder=3)
+                ha='center', va='center', zorder=3, math_fontfamily=MATH_FONT)
 
     # Title
     ax.set_title('Crosstalk', fontsize=18, fontweight='bold', pad=15)
@@ -105,22 +119,23 @@ def create_crosstalk_diagram(output_path: str):
     ax.set_aspect('equal')
     ax.axis('off')
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    save_stamped(fig, SRC_HASH, output_path)
     print(f"Created: {output_path}")
 
 
-if __name__ == '__main__':
-    import os
+def submit_figures(executor):
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    return [executor.submit(create_leakage_diagram, OUTPUT_DIR / 'leakage-diagram.png'),
+            executor.submit(create_crosstalk_diagram, OUTPUT_DIR / 'crosstalk-diagram.png')]
 
-    # Output directory
-    output_dir = 'assets/noise'
-    os.makedirs(output_dir, exist_ok=True)
 
-    # Generate diagrams
-    create_leakage_diagram(f'{output_dir}/leakage-diagram.png')
-    create_crosstalk_diagram(f'{output_dir}/crosstalk-diagram.png')
+def main():
+    with ProcessPoolExecutor() as executor:
+        for future in submit_figures(executor):
+            future.result()
 
     print("\nDone! Generated noise diagrams.")
+
+
+if __name__ == '__main__':
+    main()
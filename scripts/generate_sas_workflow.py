@@ -1,97 +1,115 @@
 #!/usr/bin/env python3
 """Generate Symmetry-Adjusted Classical Shadows workflow diagram."""
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+from pathlib import Path
+
 import numpy as np
+from matplotlib.figure import Figure
+
+import workflow_shapes
+from figure_io import is_current, save_stamped, source_hash
+from workflow_shapes import add_box_collection, draw_arrow, draw_box
+
+OUTPUT_DIR = Path(__file__).parent.parent / "images" / "techniques"
+SRC_HASH = source_hash(__file__, workflow_shapes.__file__)
+
+# Callout bbox styles, shared by every ax.text that uses them
+_BBOX_GREEN = dict(boxstyle='round', facecolor='#e8f8f5', edgecolor='#27ae60', alpha=0.8)
+
+
+def generate_sas_diagram():
+    """Box-and-arrow overview of symmetry-adjusted classical shadows."""
+    png_path = OUTPUT_DIR / 'symmetry-adjusted-shadows-workflow.png'
+    svg_path = png_path.with_suffix('.svg')
+    if is_current(SRC_HASH, png_path, svg_path):
+        return
+
+    # Set up the figure
+    fig = Figure(figsize=(12, 7), layout='constrained')
+    ax = fig.subplots()
+    boxes = []  # drawn together by add_box_collection
+    ax.set_xlim(0, 12)
+    ax.set_ylim(0, 8)
+    ax.axis('off')
+    ax.set_title('Symmetry-Adjusted Classical Shadows', fontsize=16, fontweight='bold', pad=20)
+
+    # Row 1: Input state with symmetry
+    draw_box(ax, boxes, 0.5, 6, 2.5, 1.2, 'Target State ρ\nwith symmetry Sλ', '#2c3e50')
+
+    # Arrow to quantum circuit
+    draw_arrow(ax, (3, 6.6), (3.8, 6.6))
+
+    # Noisy quantum circuit
+    draw_box(ax, boxes, 3.8, 6, 2.5, 1.2, 'Noisy Circuit\nŨ (with errors)', '#e74c3c')
 
-# Set up the figure
-fig, ax = plt.subplots(figsize=(12, 7))
-ax.set_xlim(0, 12)
-ax.set_ylim(0, 8)
-ax.axis('off')
-ax.set_title('Symmetry-Adjusted Classical Shadows', fontsize=16, fontweight='bold', pad=20)
+    # Arrow to randomized measurements
+    draw_arrow(ax, (6.3, 6.6), (7.1, 6.6))
 
-# Helper function to draw boxes
-def draw_box(ax, x, y, width, height, text, color='#3498db', text_color='white', fontsize=10):
-    rect = mpatches.FancyBboxPatch((x, y), width, height,
-                                    boxstyle="round,pad=0.05,rounding_size=0.2",
-                                    facecolor=color, edgecolor='black', linewidth=2)
-    ax.add_patch(rect)
-    ax.text(x + width/2, y + height/2, text, ha='center', va='center',
-            fontsize=fontsize, fontweight='bold', color=text_color, wrap=True)
+    # Randomized measurements (classical shadows)
+    draw_box(ax, boxes, 7.1, 6, 2.5, 1.2, 'Randomized\nMeasurements', '#9b59b6')
 
-# Helper for arrows
-def draw_arrow(ax, start, end, color='black'):
-    ax.annotate('', xy=end, xytext=start,
-                arrowprops=dict(arrowstyle='->', color=color, lw=2))
+    # Arrow down to snapshots
+    draw_arrow(ax, (8.35, 6), (8.35, 5.3))
 
-# Row 1: Input state with symmetry
-draw_box(ax, 0.5, 6, 2.5, 1.2, 'Target State ρ\nwith symmetry Sλ', '#2c3e50')
+    # Classical shadow snapshots
+    draw_box(ax, boxes, 7.1, 4.1, 2.5, 1.2, 'Shadow\nSnapshots {σ̂}', '#34495e')
 
-# Arrow to quantum circuit
-draw_arrow(ax, (3, 6.6), (3.8, 6.6))
+    # Now show the two paths: standard vs symmetry-adjusted
 
-# Noisy quantum circuit
-draw_box(ax, 3.8, 6, 2.5, 1.2, 'Noisy Circuit\nŨ (with errors)', '#e74c3c')
+    # Standard path (grayed out)
+    draw_arrow(ax, (7.1, 4.7), (5.5, 4.7))
+    draw_box(ax, boxes, 2.5, 4.1, 3, 1.2, 'Standard Inversion\nM⁻¹ (no mitigation)', '#bdc3c7', text_color='#7f8c8d')
 
-# Arrow to randomized measurements
-draw_arrow(ax, (6.3, 6.6), (7.1, 6.6))
+    # Symmetry-adjusted path (highlighted)
+    draw_arrow(ax, (8.35, 4.1), (8.35, 3.3))
 
-# Randomized measurements (classical shadows)
-draw_box(ax, 7.1, 6, 2.5, 1.2, 'Randomized\nMeasurements', '#9b59b6')
+    # Symmetry information box (side input)
+    draw_box(ax, boxes, 10, 4.5, 1.8, 1, 'Symmetry\nGroup G', '#27ae60')
+    draw_arrow(ax, (10, 5), (9.6, 3.8))
 
-# Arrow down to snapshots
-draw_arrow(ax, (8.35, 6), (8.35, 5.3))
+    # Symmetry-adjusted inversion
+    draw_box(ax, boxes, 6.5, 2.1, 3.7, 1.2, 'Symmetry-Adjusted\nInversion (group-theoretic)', '#27ae60')
 
-# Classical shadow snapshots
-draw_box(ax, 7.1, 4.1, 2.5, 1.2, 'Shadow\nSnapshots {σ̂}', '#34495e')
+    # Arrow to final result
+    draw_arrow(ax, (8.35, 2.1), (8.35, 1.3))
 
-# Now show the two paths: standard vs symmetry-adjusted
+    # Error-mitigated estimate
+    draw_box(ax, boxes, 6.5, 0.2, 3.7, 1.1, 'Error-Mitigated\nEstimate ⟨O⟩_SAS', '#2980b9')
 
-# Standard path (grayed out)
-draw_arrow(ax, (7.1, 4.7), (5.5, 4.7))
-draw_box(ax, 2.5, 4.1, 3, 1.2, 'Standard Inversion\nM⁻¹ (no mitigation)', '#bdc3c7', text_color='#7f8c8d')
+    # Add annotation boxes for key features
+    # Feature 1: No calibration
+    ax.text(0.5, 3.5, '✓ No calibration\n   experiments needed', fontsize=9, color='#27ae60',
+            bbox=_BBOX_GREEN)
 
-# Symmetry-adjusted path (highlighted)
-draw_arrow(ax, (8.35, 4.1), (8.35, 3.3))
+    # Feature 2: Full circuit mitigation
+    ax.text(0.5, 2.3, '✓ Mitigates errors in\n   full circuit, not\n   just measurements', fontsize=9, color='#27ae60',
+            bbox=_BBOX_GREEN)
 
-# Symmetry information box (side input)
-draw_box(ax, 10, 4.5, 1.8, 1, 'Symmetry\nGroup G', '#27ae60')
-draw_arrow(ax, (10, 5), (9.6, 3.8))
+    # Feature 3: No data discarded
+    ax.text(0.5, 1.0, '✓ No data discarded\n   (unlike post-selection)', fontsize=9, color='#27ae60',
+            bbox=_BBOX_GREEN)
 
-# Symmetry-adjusted inversion
-draw_box(ax, 6.5, 2.1, 3.7, 1.2, 'Symmetry-Adjusted\nInversion (group-theoretic)', '#27ae60')
+    # Add labels for the comparison
+    ax.text(4, 3.5, 'vs', fontsize=12, ha='center', va='center', color='#7f8c8d', fontweight='bold')
 
-# Arrow to final result
-draw_arrow(ax, (8.35, 2.1), (8.35, 1.3))
+    # Dashed line connecting to show alternative
+    ax.plot([5.5, 6.5], [3.5, 2.7], 'k--', alpha=0.3, lw=1.5)
 
-# Error-mitigated estimate
-draw_box(ax, 6.5, 0.2, 3.7, 1.1, 'Error-Mitigated\nEstimate ⟨O⟩_SAS', '#2980b9')
+    add_box_collection(ax, boxes)
+    save_stamped(fig, SRC_HASH, png_path, svg_path)
 
-# Add annotation boxes for key features
-# Feature 1: No calibration
-ax.text(0.5, 3.5, '✓ No calibration\n   experiments needed', fontsize=9, color='#27ae60',
-        bbox=dict(boxstyle='round', facecolor='#e8f8f5', edgecolor='#27ae60', alpha=0.8))
+    print("Symmetry-adjusted shadows workflow diagram saved!")
 
-# Feature 2: Full circuit mitigation
-ax.text(0.5, 2.3, '✓ Mitigates errors in\n   full circuit, not\n   just measurements', fontsize=9, color='#27ae60',
-        bbox=dict(boxstyle='round', facecolor='#e8f8f5', edgecolor='#27ae60', alpha=0.8))
 
-# Feature 3: No data discarded
-ax.text(0.5, 1.0, '✓ No data discarded\n   (unlike post-selection)', fontsize=9, color='#27ae60',
-        bbox=dict(boxstyle='round', facecolor='#e8f8f5', edgecolor='#27ae60', alpha=0.8))
+def submit_figures(executor):
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    return [executor.submit(generate_sas_diagram)]
 
-# Add labels for the comparison
-ax.text(4, 3.5, 'vs', fontsize=12, ha='center', va='center', color='#7f8c8d', fontweight='bold')
 
-# Dashed line connecting to show alternative
-ax.plot([5.5, 6.5], [3.5, 2.7], 'k--', alpha=0.3, lw=1.5)
+def main():
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    generate_sas_diagram()
 
-plt.tight_layout()
-plt.savefig('/Users/vincent.russo/Projects/research/qemzoo/images/techniques/symmetry-adjusted-shadows-workflow.png',
-            dpi=150, bbox_inches='tight', facecolor='white')
-plt.savefig('/Users/vincent.russo/Projects/research/qemzoo/images/techniques/symmetry-adjusted-shadows-workflow.svg',
-            bbox_inches='tight', facecolor='white')
 
-print("Symmetry-adjusted shadows workflow diagram saved!")
+if __name__ == "__main__":
+    main()
@@ -1,79 +1,122 @@
 #!/usr/bin/env python3
 """Generate ZNE workflow diagram similar to Majumdar et al. 2023 Figure 1."""
 
-import matplotlib.pyplot as plt
-import numpy as np
+import math
+import os
+from pathlib import Path
 
-# Set up the figure
-fig, ax = plt.subplots(figsize=(8, 6))
-
-# Noise factors and expectation values (simulating exponential decay)
-lambda_factors = np.array([1, 2, 3])
-# Simulated noisy expectation values (decaying with noise)
-E_values = np.array([0.65, 0.45, 0.32])
-E_errors = np.array([0.03, 0.04, 0.05])
-
-# The "ideal" zero-noise value we're extrapolating to
-E_star = 0.85
-
-# Create smooth curve for extrapolation fit
-lambda_smooth = np.linspace(0, 3.5, 100)
-# Exponential fit: E = E* * exp(-k*lambda)
-k = -np.log(E_values[0] / E_star) / lambda_factors[0]
-E_fit = E_star * np.exp(-k * lambda_smooth)
-
-# Plot the extrapolation curve (dashed)
-ax.plot(lambda_smooth, E_fit, 'b--', linewidth=2, alpha=0.7, label='Extrapolation fit')
-
-# Plot the data points with error bars
-ax.errorbar(lambda_factors, E_values, yerr=E_errors, fmt='o', markersize=12,
-            color='#e74c3c', capsize=5, capthick=2, elinewidth=2,
-            label='Measured values', zorder=5)
-
-# Plot the extrapolated zero-noise point
-ax.plot(0, E_star, 's', markersize=14, color='#2ecc71', markeredgecolor='black',
-        markeredgewidth=2, label='Zero-noise estimate E*', zorder=6)
-
-# Add horizontal dashed lines from y-axis to points
-for i, (lam, E) in enumerate(zip(lambda_factors, E_values)):
-    ax.hlines(E, 0, lam, colors='gray', linestyles='dotted', alpha=0.5)
-    ax.vlines(lam, 0, E, colors='gray', linestyles='dotted', alpha=0.5)
-
-# Add E* horizontal line
-ax.hlines(E_star, 0, 0.3, colors='#2ecc71', linestyles='dotted', alpha=0.7, linewidth=2)
-
-# Labels
-ax.set_xlabel('Noise factor λ', fontsize=14)
-ax.set_ylabel('Expectation value', fontsize=14)
-
-# Add annotations for noise levels
-ax.annotate('λ₁', (lambda_factors[0], -0.02), ha='center', fontsize=12)
-ax.annotate('λ₂', (lambda_factors[1], -0.02), ha='center', fontsize=12)
-ax.annotate('λ₃', (lambda_factors[2], -0.02), ha='center', fontsize=12)
-
-# Add annotations for E values
-ax.annotate('E(λ₁)', (lambda_factors[0] + 0.15, E_values[0]), fontsize=11, color='#e74c3c')
-ax.annotate('E(λ₂)', (lambda_factors[1] + 0.15, E_values[1]), fontsize=11, color='#e74c3c')
-ax.annotate('E(λ₃)', (lambda_factors[2] + 0.15, E_values[2]), fontsize=11, color='#e74c3c')
-ax.annotate('E*', (-0.15, E_star), fontsize=12, fontweight='bold', color='#2ecc71')
-
-# Set axis limits
-ax.set_xlim(-0.3, 3.7)
-ax.set_ylim(0, 1.0)
-
-# Remove top and right spines
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-
-# Add legend
-ax.legend(loc='upper right', fontsize=11, framealpha=0.9)
-
-# Title
-ax.set_title('Zero-Noise Extrapolation', fontsize=16, fontweight='bold', pad=15)
-
-plt.tight_layout()
-plt.savefig('/Users/vincent.russo/Projects/research/qemzoo/images/techniques/zne-workflow.png',
-            dpi=150, bbox_inches='tight', facecolor='white')
-plt.savefig('/Users/vincent.russo/Projects/research/qemzoo/images/techniques/zne-workflow.svg',
-            bbox_inches='tight', facecolor='white')
-print("ZNE workflow diagram saved!")
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+
+from figure_io import is_current, save_stamped, source_hash
+
+try:
+    import numexpr as ne
+    ne.set_num_threads(os.cpu_count())
+except ImportError:
+    ne = None
+
+OUTPUT_DIR = Path(__file__).parent.parent / "images" / "techniques"
+SRC_HASH = source_hash(__file__)
+
+
+def render(out_dir=OUTPUT_DIR):
+    """Draw the ZNE extrapolation plot and save it as PNG and SVG in out_dir."""
+    png_path = Path(out_dir) / 'zne-workflow.png'
+    svg_path = png_path.with_suffix('.svg')
+    if is_current(SRC_HASH, png_path, svg_path):
+        return
+
+    # Set up the figure
+    fig = Figure(figsize=(8, 6), layout='constrained')
+    ax = fig.subplots()
+
+    # Noise factors and expectation values (simulating exponential decay)
+    lambda_factors = np.array([1, 2, 3])
+    # Simulated noisy expectation values (decaying with noise)
+    E_values = np.array([0.65, 0.45, 0.32])
+    E_errors = np.array([0.03, 0.04, 0.05])
+
+    # The "ideal" zero-noise value we're extrapolating to
+    E_star = 0.85
+
+    # Create smooth curve for extrapolation fit
+    lambda_smooth = np.linspace(0, 3.5, 32)  # a smooth exponential needs few samples
+    # Exponential fit: E = E* * exp(-k*lambda)
+    # k is a plain float, so -k * lambda_smooth takes NumPy's scalar fast path
+    k = -math.log(float(E_values[0]) / E_star) / float(lambda_factors[0])
+    if ne is not None:
+        # Fused multiply/exp in one pass, without the -k*lambda temporary
+        E_fit = ne.evaluate("E_star * exp(-k * lambda_smooth)")
+    else:
+        E_fit = E_star * np.exp(-k * lambda_smooth)
+
+    # Plot the extrapolation curve (dashed)
+    ax.plot(lambda_smooth, E_fit, 'b--', linewidth=2, alpha=0.7, label='Extrapolation fit')
+
+    # Plot the data points with error bars
+    ax.errorbar(lambda_factors, E_values, yerr=E_errors, fmt='o', markersize=12,
+                color='#e74c3c', capsize=5, capthick=2, elinewidth=2,
+                label='Measured values', zorder=5)
+
+    # Plot the extrapolated zero-noise point
+    ax.plot(0, E_star, 's', markersize=14, color='#2ecc71', markeredgecolor='black',
+            markeredgewidth=2, label='Zero-noise estimate E*', zorder=6)
+
+    # Dotted guide lines from both axes to each point, plus the E* marker line,
+    # drawn as one LineCollection
+    points = np.column_stack([lambda_factors, E_values])
+    on_y_axis = np.column_stack([np.zeros_like(E_values), E_values])
+    on_x_axis = np.column_stack([lambda_factors, np.zeros_like(E_values)])
+    guide_segments = np.concatenate([np.stack([on_y_axis, points], axis=1),
+                                     np.stack([on_x_axis, points], axis=1),
+                                     [[(0, E_star), (0.3, E_star)]]])
+    n_guides = 2 * len(lambda_factors)
+    ax.add_collection(LineCollection(
+        guide_segments, linestyles='dotted',
+        colors=[to_rgba('gray', 0.5)] * n_guides + [to_rgba('#2ecc71', 0.7)],
+        linewidths=[1.5] * n_guides + [2]))
+
+    # Labels
+    ax.set_xlabel('Noise factor λ', fontsize=14)
+    ax.set_ylabel('Expectation value', fontsize=14)
+
+    # Add annotations for E values, sharing one FontProperties
+    value_font = FontProperties(size=11)
+    for x, y, label in zip(lambda_factors + 0.15, E_values, ['E(λ₁)', 'E(λ₂)', 'E(λ₃)']):
+        ax.text(x, y, label, fontproperties=value_font, color='#e74c3c')
+    ax.annotate('E*', (-0.15, E_star), fontsize=12, fontweight='bold', color='#2ecc71')
+
+    # Set axis limits
+    ax.set_xlim(-0.3, 3.7)
+    ax.set_ylim(0, 1.0)
+
+    # Remove top and right spines
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+
+    # Add legend
+    ax.legend(loc='upper right', fontsize=11, framealpha=0.9)
+
+    # Title
+    ax.set_title('Zero-Noise Extrapolation', fontsize=16, fontweight='bold', pad=15)
+
+    save_stamped(fig, SRC_HASH, png_path, svg_path)
+    print("ZNE workflow diagram saved!")
+
+
+def submit_figures(executor):
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    return [executor.submit(render)]
+
+
+def main():
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    render()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Box and arrow helpers shared by the workflow diagram scripts."""
+
+import matplotlib.patches as mpatches
+from matplotlib.collections import PatchCollection
+
+# Box style and label settings are built once and shared by every box
+_BOX_STYLE = mpatches.BoxStyle("round", pad=0.05, rounding_size=0.2)
+_BOX_TEXT_KW = dict(ha='center', va='center', fontweight='bold', wrap=True)
+
+
+def draw_box(ax, boxes, x, y, width, height, text, color='#3498db', text_color='white', fontsize=10):
+    """Append a rounded box to the diagram's boxes list and draw its centred label now."""
+    boxes.append((mpatches.FancyBboxPatch((x, y), width, height, boxstyle=_BOX_STYLE), color))
+    ax.text(x + width/2, y + height/2, text, fontsize=fontsize, color=text_color, **_BOX_TEXT_KW)
+
+
+def add_box_collection(ax, boxes):
+    """Draw a diagram's boxes, as collected by draw_box, as a single PatchCollection."""
+    patches = [patch for patch, _ in boxes]
+    colors = [color for _, color in boxes]
+    ax.add_collection(PatchCollection(patches, facecolors=colors, edgecolors='black', linewidths=2))
+
+
+def draw_arrow(ax, start, end, color='black', lw=2, linestyle='-'):
+    """Draw a bare arrow patch, without the Annotation text machinery."""
+    # zorder keeps arrows above the box collection
+    ax.add_patch(mpatches.FancyArrowPatch(start, end, arrowstyle='->', color=color, lw=lw,
+                                          linestyle=linestyle, mutation_scale=10, zorder=3))